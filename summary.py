@@ -6,33 +6,106 @@
 
 import argparse
 import json
+import os
 import re
+import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from collections import defaultdict
-from typing import Optional
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Optional
+
+# JSON helpers shared with uscis_watcher: orjson is used when installed (it is
+# not a declared dependency, so the stdlib json path is the default)
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(data: Any) -> bytes:
+        """Serialize data as 2-space indented JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(data: Any) -> bytes:
+        """Serialize data as 2-space indented JSON bytes."""
+        return json.dumps(data, indent=2).encode()
+
+# Use ciso8601 for faster timestamp parsing when it is installed
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
 
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_DIR = SCRIPT_DIR / "output"
 CONFIG_FILE = SCRIPT_DIR / "config.json"
 
+# Only color changed rows when writing to a terminal, so piped output stays free of ANSI escapes
+USE_COLOR = sys.stdout is not None and sys.stdout.isatty()
 
+# Placeholder for timeline columns with no event or silent update
+EMPTY_CELL = "·"
+
+# Form types shown first in the summary, in this order; any others follow alphabetically
+FORM_ORDER = ("I-131", "I-765", "I-485")
+
+# Patterns used by slugify, compiled once
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+
+# Identifies one version of a file on disk: (mtime_ns, size, inode). The inode changes on
+# every atomic replace, so a rewrite is noticed even within one coarse mtime tick.
+FileStamp = tuple[int, int, int]
+
+# Files read from each receipt folder
+RECEIPT_FILES = ("latest.json", "receipt_info.json", "silent_updates.json")
+
+# Parsed JSON files keyed by path, stored with the stamp of the file they were read from
+_JSON_CACHE: dict[Path, tuple[FileStamp, Any]] = {}
+
+# Receipts keyed by folder, stored with the parsed latest.json they were built from
+_RECEIPT_CACHE: dict[Path, tuple[Any, dict]] = {}
+
+
+@lru_cache(maxsize=256)
 def slugify(text: str) -> str:
     """Convert text to a filesystem-safe slug"""
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _SLUG_STRIP.sub('', text)
+    text = _SLUG_DASH.sub('-', text)
     return text
 
 
+def _file_stamp(st: os.stat_result) -> FileStamp:
+    """Stamp for a stat result, used to tell whether a file changed since it was last read."""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_json_cached(path: Path, stamp: Optional[FileStamp] = None) -> Any:
+    """Load a JSON file, reusing the previous parse if the file is unchanged on disk."""
+    if stamp is None:
+        stamp = _file_stamp(path.stat())
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    data = json_loads(path.read_bytes())
+    _JSON_CACHE[path] = (stamp, data)
+    return data
+
+
 def load_anon_mapping() -> dict[str, str]:
     """Load nickname to anon_name mapping from config"""
     if not CONFIG_FILE.exists():
         return {}
 
     try:
-        with open(CONFIG_FILE) as f:
-            config = json.load(f)
+        config = _read_json_cached(CONFIG_FILE)
 
         mapping = {}
         for account in config.get("accounts", []):
@@ -54,11 +127,19 @@ def load_anon_mapping() -> dict[str, str]:
         return {}
 
 
-def get_time_ago(timestamp: str) -> str:
+@lru_cache(maxsize=None)
+def _parse_ts(timestamp: str) -> datetime:
+    """Parse an ISO timestamp, memoized since the same strings recur across a render."""
+    if timestamp.endswith("Z"):
+        return _parse_iso(timestamp[:-1] + "+00:00")
+    return _parse_iso(timestamp)
+
+
+def get_time_ago(timestamp: str, now: Optional[datetime] = None) -> str:
     """Convert timestamp to human-readable relative time."""
-    then = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    now = datetime.now(timezone.utc)
-    diff = now - then
+    if now is None:
+        now = datetime.now(timezone.utc)
+    diff = now - _parse_ts(timestamp)
 
     total_seconds = int(diff.total_seconds())
     minutes = total_seconds // 60
@@ -78,74 +159,91 @@ def get_time_ago(timestamp: str) -> str:
         return "just now"
 
 
-def has_event_code(events: list, event_code: str) -> bool:
-    """Check if there's an event with the given event code."""
-    return any(e.get("eventCode") == event_code for e in events)
+def get_event_columns(receipt: dict) -> tuple[list, list, list]:
+    """
+    Get a receipt's events as parallel (codes, timestamps, dates) lists.
+
+    Built once on first use and cached on the receipt, so the aggregations below
+    scan flat lists instead of repeating dict lookups on every event.
+    Missing fields are kept as None so the lists stay aligned with the events.
+    """
+    if "_event_columns" not in receipt:
+        events = receipt.get("events", [])
+        codes = [e.get("eventCode") for e in events]
+        timestamps = [e.get("eventTimestamp") for e in events]
+        dates = [get_date_from_timestamp(t) if t else None for t in timestamps]
+        receipt["_event_columns"] = (codes, timestamps, dates)
+    return receipt["_event_columns"]
+
+
+def get_events_by_code(receipt: dict) -> dict[str, list[str]]:
+    """Get a receipt's event timestamps indexed by event code, each list sorted chronologically."""
+    if "_by_code" not in receipt:
+        codes, timestamps, _ = get_event_columns(receipt)
+        by_code = {}
+        for code, timestamp in zip(codes, timestamps):
+            if code:
+                code_timestamps = by_code.setdefault(code, [])
+                if timestamp:
+                    code_timestamps.append(timestamp)
+        for code_timestamps in by_code.values():
+            code_timestamps.sort()
+        receipt["_by_code"] = by_code
+    return receipt["_by_code"]
+
+
+def has_event_code(receipt: dict, event_code: str) -> bool:
+    """Check if the receipt has an event with the given event code."""
+    return event_code in get_events_by_code(receipt)
 
 
-def get_days_since(timestamp: str) -> int:
+def get_days_since(timestamp: str, now: Optional[datetime] = None) -> int:
     """Calculate days since a timestamp."""
-    then = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    now = datetime.now(timezone.utc)
+    then = _parse_ts(timestamp)
+    if now is None:
+        now = datetime.now(timezone.utc)
     diff = now - then
     return diff.days
 
 
 def get_days_between(start_timestamp: str, end_timestamp: str) -> int:
     """Calculate days between two timestamps."""
-    start = datetime.fromisoformat(start_timestamp.replace("Z", "+00:00"))
-    end = datetime.fromisoformat(end_timestamp.replace("Z", "+00:00"))
+    start = _parse_ts(start_timestamp)
+    end = _parse_ts(end_timestamp)
     diff = end - start
     return diff.days
 
 
-def get_event_occurrences(events: list, event_code: str) -> list[str]:
-    """Get all timestamps for events with the given event code, sorted chronologically."""
-    timestamps = []
-    for event in events:
-        if event.get("eventCode") == event_code:
-            timestamp = event.get("eventTimestamp")
-            if timestamp:
-                timestamps.append(timestamp)
-    # Sort chronologically (earliest first)
-    timestamps.sort()
-    return timestamps
+def get_event_occurrences(receipt: dict, event_code: str) -> list[str]:
+    """Get all timestamps for the receipt's events with the given event code, sorted chronologically."""
+    return get_events_by_code(receipt).get(event_code, [])
 
 
 def count_max_event_occurrences(receipts: list[dict], event_code: str) -> int:
     """Count the maximum number of times an event code appears in any single receipt."""
-    max_count = 0
-    for receipt in receipts:
-        events = receipt.get("events", [])
-        count = sum(1 for e in events if e.get("eventCode") == event_code)
-        max_count = max(max_count, count)
-    return max_count
+    return max((len(get_events_by_code(receipt).get(event_code, [])) for receipt in receipts), default=0)
 
 
 def get_earliest_event_timestamp(receipts: list[dict], event_code: str) -> str:
     """Get the earliest eventTimestamp for a given event code across all receipts."""
-    timestamps = []
+    earliest = ""
     for receipt in receipts:
-        events = receipt.get("events", [])
-        for event in events:
-            if event.get("eventCode") == event_code:
-                timestamp = event.get("eventTimestamp")
-                if timestamp:
-                    timestamps.append(timestamp)
-
-    return min(timestamps) if timestamps else ""
+        # Per-code lists are sorted, so the first entry is this receipt's earliest
+        code_timestamps = get_events_by_code(receipt).get(event_code)
+        if code_timestamps and (not earliest or code_timestamps[0] < earliest):
+            earliest = code_timestamps[0]
+    return earliest
 
 
 def get_date_from_timestamp(timestamp: str) -> str:
     """Extract date (YYYY-MM-DD) from ISO timestamp."""
-    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    return dt.strftime("%Y-%m-%d")
+    # ISO 8601 timestamps start with the date, so no parsing is needed
+    return timestamp[:10]
 
 
 def get_short_date(timestamp: str) -> str:
     """Extract short date (M/D) from ISO timestamp."""
-    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    return f"{dt.month}/{dt.day}"
+    return f"{int(timestamp[5:7])}/{int(timestamp[8:10])}"
 
 
 def build_timeline(receipts: list[dict]) -> list[tuple[str, str, str, int]]:
@@ -158,58 +256,58 @@ def build_timeline(receipts: list[dict]) -> list[tuple[str, str, str, int]]:
     - date: the date (YYYY-MM-DD) for this group
     - count: how many columns needed (max occurrences for any single case on this date)
     """
-    # Group events by (code, date) and track max occurrences
-    event_groups = defaultdict(lambda: {"date": "", "timestamps": set(), "max_count": 0})
+    # Group events by (code, date) and silent updates by date in a single pass.
+    # Each group is a [date, earliest_timestamp, max_count] record; ISO timestamps
+    # compare chronologically as strings, so a running min replaces a set of all of them.
+    event_groups = {}
+    silent_groups = {}
 
     for receipt in receipts:
-        events = receipt.get("events", [])
-        # Track occurrences per (code, date) for this receipt
+        codes, timestamps, dates = get_event_columns(receipt)
+        silent_updates = get_silent_updates(receipt)
+        # Track occurrences per (code, date) and per silent date for this receipt
         receipt_event_counts = defaultdict(int)
+        receipt_silent_counts = defaultdict(int)
 
-        for event in events:
-            code = event.get("eventCode")
-            timestamp = event.get("eventTimestamp")
+        for code, timestamp, date in zip(codes, timestamps, dates):
             if code and timestamp:
-                date = get_date_from_timestamp(timestamp)
                 key = (code, date)
-                event_groups[key]["date"] = date
-                event_groups[key]["timestamps"].add(timestamp)
+                group = event_groups.get(key)
+                if group is None:
+                    group = event_groups[key] = [date, timestamp, 0]
+                elif timestamp < group[1]:
+                    group[1] = timestamp
                 receipt_event_counts[key] += 1
 
-        # Update max counts
-        for key, count in receipt_event_counts.items():
-            event_groups[key]["max_count"] = max(event_groups[key]["max_count"], count)
-
-    # Group silent updates by date
-    silent_groups = defaultdict(lambda: {"date": "", "timestamps": set(), "max_count": 0})
-
-    for receipt in receipts:
-        silent_updates = receipt.get("silent_updates", [])
-        receipt_silent_counts = defaultdict(int)
-
         for silent_ts in silent_updates:
             date = get_date_from_timestamp(silent_ts)
-            silent_groups[date]["date"] = date
-            silent_groups[date]["timestamps"].add(silent_ts)
+            group = silent_groups.get(date)
+            if group is None:
+                group = silent_groups[date] = [date, silent_ts, 0]
+            elif silent_ts < group[1]:
+                group[1] = silent_ts
             receipt_silent_counts[date] += 1
 
         # Update max counts
+        for key, count in receipt_event_counts.items():
+            group = event_groups[key]
+            if count > group[2]:
+                group[2] = count
         for date, count in receipt_silent_counts.items():
-            silent_groups[date]["max_count"] = max(silent_groups[date]["max_count"], count)
+            group = silent_groups[date]
+            if count > group[2]:
+                group[2] = count
 
     # Build timeline entries
     timeline = []
 
     # Add event groups
-    for (code, date), info in event_groups.items():
-        # Get earliest timestamp from this group for sorting
-        earliest = min(info["timestamps"])
-        timeline.append((earliest, "event", code, date, info["max_count"]))
+    for (code, _), (date, earliest, max_count) in event_groups.items():
+        timeline.append((earliest, "event", code, date, max_count))
 
     # Add silent update groups
-    for date, info in silent_groups.items():
-        earliest = min(info["timestamps"])
-        timeline.append((earliest, "silent", "S", date, info["max_count"]))
+    for date, earliest, max_count in silent_groups.values():
+        timeline.append((earliest, "silent", "S", date, max_count))
 
     # Sort by earliest timestamp in each group
     timeline.sort(key=lambda x: x[0])
@@ -218,135 +316,206 @@ def build_timeline(receipts: list[dict]) -> list[tuple[str, str, str, int]]:
     return [(typ, identifier, date, count) for _, typ, identifier, date, count in timeline]
 
 
-def get_last_event_time(events: list) -> str:
+def get_last_event_time(events: list, now: Optional[datetime] = None) -> str:
     """Get the timestamp of the most recent event."""
     if not events:
         return "N/A"
-    # Find the most recent event by createdAtTimestamp
-    latest = max(events, key=lambda e: e.get("createdAtTimestamp", ""))
-    timestamp = latest.get("createdAtTimestamp", "")
-    if not timestamp:
-        return "N/A"
-    return get_time_ago(timestamp)
+    # Find the most recent createdAtTimestamp; events are not guaranteed to be
+    # ordered (new ones are prepended), so scan once rather than trusting an end
+    timestamp = ""
+    for event in events:
+        created_at = event.get("createdAtTimestamp")
+        if created_at and created_at > timestamp:
+            timestamp = created_at
+    return get_time_ago(timestamp, now) if timestamp else "N/A"
+
+
+def _stat_receipt_files(folder: Path) -> dict[str, FileStamp]:
+    """Map each receipt file present in a folder to its stamp."""
+    stamps = {}
+    for name in RECEIPT_FILES:
+        try:
+            stamps[name] = _file_stamp(os.stat(folder / name))
+        except FileNotFoundError:
+            # Only this file is absent; the others are still stamped
+            continue
+    return stamps
 
 
-def load_receipt_info(folder: Path) -> Optional[dict]:
+def load_receipt_info(folder: Path, stamps: Optional[dict[str, FileStamp]] = None) -> Optional[dict]:
     """Load receipt_info.json from a folder if it exists."""
-    receipt_info_path = folder / "receipt_info.json"
-    if not receipt_info_path.exists():
+    if stamps is not None and "receipt_info.json" not in stamps:
         return None
-
+    receipt_info_path = folder / "receipt_info.json"
     try:
-        with open(receipt_info_path) as f:
-            data = json.load(f)
+        data = _read_json_cached(receipt_info_path, stamps and stamps["receipt_info.json"])
         return data.get("data", {}).get("receipt_details", {}) if data.get("data") else None
     except Exception:
         return None
 
 
-def load_silent_updates(folder: Path) -> list[str]:
+def load_silent_updates(folder: Path, stamps: Optional[dict[str, FileStamp]] = None) -> list[str]:
     """Load silent update timestamps from silent_updates.json."""
-    silent_updates_path = folder / "silent_updates.json"
-    if not silent_updates_path.exists():
+    if stamps is not None and "silent_updates.json" not in stamps:
         return []
-
+    silent_updates_path = folder / "silent_updates.json"
     try:
-        with open(silent_updates_path) as f:
-            data = json.load(f)
+        data = _read_json_cached(silent_updates_path, stamps and stamps["silent_updates.json"])
         return data.get("silent_updates", [])
     except Exception:
         return []
 
 
+def get_receipt_info(receipt: dict) -> Optional[dict]:
+    """Get a receipt's receipt_info, loading receipt_info.json on first use."""
+    if "receipt_info" not in receipt:
+        folder = receipt.get("folder")
+        receipt["receipt_info"] = load_receipt_info(folder, receipt.get("_stamps")) if folder else None
+    return receipt["receipt_info"]
+
+
+def get_silent_updates(receipt: dict) -> list[str]:
+    """Get a receipt's silent update timestamps, loading silent_updates.json on first use."""
+    if "silent_updates" not in receipt:
+        folder = receipt.get("folder")
+        receipt["silent_updates"] = load_silent_updates(folder, receipt.get("_stamps")) if folder else []
+    return receipt["silent_updates"]
+
+
 def count_silent_updates_between(silent_updates: list[str], start_time: Optional[str], end_time: Optional[str]) -> int:
     """
     Count silent updates that occurred between start_time and end_time.
     If start_time is None, count from beginning.
     If end_time is None, count until now.
     """
+    # Parse the range bounds once rather than per silent update
+    start_dt = None
+    if start_time:
+        try:
+            start_dt = _parse_ts(start_time)
+        except Exception:
+            pass
+
+    end_dt = None
+    if end_time:
+        try:
+            end_dt = _parse_ts(end_time)
+        except Exception:
+            pass
+
     count = 0
     for timestamp in silent_updates:
         # Parse timestamp
         try:
-            ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            ts = _parse_ts(timestamp)
         except Exception:
             continue
 
         # Check if within range
-        after_start = True
-        if start_time:
-            try:
-                start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                after_start = ts > start_dt
-            except Exception:
-                pass
-
-        before_end = True
-        if end_time:
-            try:
-                end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-                before_end = ts < end_dt
-            except Exception:
-                pass
-
-        if after_start and before_end:
+        if (start_dt is None or ts > start_dt) and (end_dt is None or ts < end_dt):
             count += 1
 
     return count
 
 
-def load_all_receipts(anon_mapping: Optional[dict[str, str]] = None) -> list[dict]:
-    """Load all receipts from output folders."""
-    receipts = []
-
-    for folder in OUTPUT_DIR.iterdir():
-        if not folder.is_dir():
-            continue
+def load_receipt(folder: Path, anon_mapping: Optional[dict[str, str]] = None) -> Optional[dict]:
+    """Load the receipt stored in a single output folder, or None if there isn't one."""
+    latest_path = folder / "latest.json"
+    try:
+        # Stamp latest.json and its side files up front so the JSON cache can be
+        # checked and the side files loaded later without another stat
+        stamps = _stat_receipt_files(folder)
+        if "latest.json" not in stamps:
+            # Folder without a latest.json yet
+            return None
+        data = _read_json_cached(latest_path, stamps["latest.json"])
+
+        if data.get("data"):
+            folder_name = folder.name
+            # Apply anon mapping if provided
+            if anon_mapping and folder_name in anon_mapping:
+                display_name = anon_mapping[folder_name]
+            else:
+                display_name = folder_name
+
+            # Reuse the previous receipt (and its event indexes) if latest.json is unchanged,
+            # i.e. the JSON cache handed back the same parsed object
+            cached = _RECEIPT_CACHE.get(folder)
+            if cached and cached[0] is data:
+                receipt = cached[1]
+                receipt["nickname"] = display_name
+                receipt["_stamps"] = stamps
+                # Side files can change independently; reload them through the JSON cache
+                receipt.pop("receipt_info", None)
+                receipt.pop("silent_updates", None)
+                return receipt
+
+            # receipt_info and silent_updates are loaded from the folder on first use
+            receipt = {"nickname": display_name, "folder_name": folder_name, "folder": folder, "_stamps": stamps, **data["data"]}
+            _RECEIPT_CACHE[folder] = (data, receipt)
+            return receipt
+    except FileNotFoundError:
+        # latest.json removed between the listing and the read
+        return None
+    except Exception as e:
+        print(f"Error reading {latest_path}: {e}")
 
-        latest_path = folder / "latest.json"
-        if not latest_path.exists():
-            continue
+    return None
 
-        try:
-            with open(latest_path) as f:
-                data = json.load(f)
-
-            if data.get("data"):
-                folder_name = folder.name
-                # Apply anon mapping if provided
-                if anon_mapping and folder_name in anon_mapping:
-                    display_name = anon_mapping[folder_name]
-                else:
-                    display_name = folder_name
 
-                receipt = {"nickname": display_name, "folder_name": folder_name, **data["data"]}
-                # Load receipt_info for location
-                receipt_info = load_receipt_info(folder)
-                if receipt_info:
-                    receipt["receipt_info"] = receipt_info
-                # Load silent updates timestamps
-                silent_updates = load_silent_updates(folder)
-                receipt["silent_updates"] = silent_updates
-                receipts.append(receipt)
-        except Exception as e:
-            print(f"Error reading {latest_path}: {e}")
+def load_all_receipts(anon_mapping: Optional[dict[str, str]] = None) -> list[dict]:
+    """Load all receipts from output folders."""
+    # scandir entries carry the file type from the directory listing, so no extra stat per folder
+    with os.scandir(OUTPUT_DIR) as entries:
+        folders = [Path(entry.path) for entry in entries if entry.is_dir()]
 
-    return receipts
+    # File reads release the GIL, so load folders concurrently
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda folder: load_receipt(folder, anon_mapping), folders)
+        return [receipt for receipt in results if receipt]
 
 
 def group_by_form_type(receipts: list[dict]) -> dict[str, list[dict]]:
     """Group receipts by form type."""
-    groups = defaultdict(list)
+    groups: dict[str, list[dict]] = {}
     for receipt in receipts:
-        groups[receipt.get("formType", "Unknown")].append(receipt)
-    return dict(groups)
+        groups.setdefault(receipt.get("formType", "Unknown"), []).append(receipt)
+    return groups
+
 
+def format_timeline_cell(timestamp: Optional[str], now: datetime, show_dates: bool = False, iaf_timestamp: Optional[str] = None) -> str:
+    """Format a timeline cell as M/D, days since filing (IAF), or days ago; EMPTY_CELL if empty."""
+    if not timestamp:
+        return EMPTY_CELL
+    if show_dates:
+        return get_short_date(timestamp)
+    if iaf_timestamp:
+        return f"{get_days_between(iaf_timestamp, timestamp)}d"
+    return f"{get_days_since(timestamp, now)}d"
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write lines to stdout in one call, as encoded bytes when stdout has a binary buffer."""
+    text = "\n".join(lines) + "\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(text)
+        return
+    # Anything already printed through the text layer must go out first
+    sys.stdout.flush()
+    buffer.write(text.encode(sys.stdout.encoding or "utf-8", errors="replace"))
+    buffer.flush()
+
+
+def print_table(form_type: str, receipts: list[dict], changed_nicknames: Optional[set[str]] = None, days_since_filing: bool = False, show_dates: bool = False, now: Optional[datetime] = None, out: Optional[list[str]] = None) -> None:
+    """Print a table for a specific form type, or append its lines to out if given."""
+    # Use one reference time for every cell in the table
+    if now is None:
+        now = datetime.now(timezone.utc)
 
-def print_table(form_type: str, receipts: list[dict], changed_nicknames: Optional[set[str]] = None, days_since_filing: bool = False, show_dates: bool = False) -> None:
-    """Print a table for a specific form type."""
     # ANSI color codes
-    RED = "\033[91m"
-    RESET = "\033[0m"
+    RED, RESET = ("\033[91m", "\033[0m") if USE_COLOR else ("", "")
 
     # Build timeline of all events and silent updates
     timeline = build_timeline(receipts)
@@ -354,10 +523,21 @@ def print_table(form_type: str, receipts: list[dict], changed_nicknames: Optiona
     # Build headers: Nickname, Loc, [timeline columns]
     headers = ["Nickname", "Loc"]
 
+    # Total columns for each event code across all dates, used for header naming
+    totals_by_code = Counter()
+    for typ, identifier, _, count in timeline:
+        if typ == "event":
+            totals_by_code[identifier] += count
+
     # Track event code occurrence numbers for header naming
     event_occurrence_count = {}
     silent_occurrence_count = 0
 
+    # Flattened column layout shared by every row: one (group_key, index) entry per
+    # timeline column, where group_key is (code, date) for events or the date for
+    # silent updates, and index picks the Nth timestamp in that group
+    column_plan = []
+
     # Add columns for each timeline entry
     for item in timeline:
         typ = item[0]
@@ -368,18 +548,18 @@ def print_table(form_type: str, receipts: list[dict], changed_nicknames: Optiona
         if typ == "event":
             # Create 'count' number of columns for this (event_code, date) group
             for i in range(count):
+                column_plan.append(((identifier, date), i))
                 event_occurrence_count[identifier] = event_occurrence_count.get(identifier, 0) + 1
                 occurrence = event_occurrence_count[identifier]
 
-                # Count total columns for this event code across all dates
-                total_occurrences = sum(item2[3] for item2 in timeline if item2[0] == "event" and item2[1] == identifier)
-                if total_occurrences == 1:
+                if totals_by_code[identifier] == 1:
                     headers.append(identifier)
                 else:
                     headers.append(f"{identifier}-{occurrence}")
         else:  # silent update
             # Create 'count' number of columns for this date
             for i in range(count):
+                column_plan.append((date, i))
                 silent_occurrence_count += 1
                 headers.append(f"S{silent_occurrence_count}")
 
@@ -394,140 +574,107 @@ def print_table(form_type: str, receipts: list[dict], changed_nicknames: Optiona
 
     total_width = sum(col_widths)
 
-    print()
-    print("=" * total_width)
+    # One left-aligned format template for the whole row, so each row (and the
+    # header) is padded with a single format call instead of a ljust per cell
+    row_fmt = "".join(f"{{:<{w}}}" for w in col_widths)
+
+    # Collect the whole table and write it out once at the end
+    lines = ["", "=" * total_width]
     form_name = receipts[0].get("formName", "") if receipts else ""
-    print(f"  {form_type} - {form_name}")
-    print("=" * total_width)
+    lines.append(f"  {form_type} - {form_name}")
+    lines.append("=" * total_width)
 
     # Table header
-    header_line = "".join(h.ljust(w) for h, w in zip(headers, col_widths))
-    print(header_line)
-    print("-" * total_width)
+    header_line = row_fmt.format(*headers)
+    lines.append(header_line)
+    lines.append("-" * total_width)
+
+    # Hoist per-row lookups out of the loop
+    format_row = row_fmt.format
+    # Without color there is nothing to highlight
+    changed = (changed_nicknames or set()) if USE_COLOR else set()
 
     # Table rows
     for receipt in receipts:
-        events = receipt.get("events", [])
-        silent_updates = receipt.get("silent_updates", [])
-        location = receipt.get("receipt_info", {}).get("location", "-") if receipt.get("receipt_info") else "-"
+        codes, timestamps, _ = get_event_columns(receipt)
+        events_by_code = get_events_by_code(receipt)
+        silent_updates = get_silent_updates(receipt)
+        receipt_info = get_receipt_info(receipt)
+        location = receipt_info.get("location", "-") if receipt_info else "-"
 
         # Find IAF timestamp for this receipt (if using days_since_filing)
         iaf_timestamp = None
-        if days_since_filing:
-            for event in events:
-                if event.get("eventCode") == "IAF":
-                    iaf_timestamp = event.get("eventTimestamp")
-                    break
-
-        # Create lookup maps for this receipt - group by (code, date)
-        event_timestamps_by_date = defaultdict(list)  # (code, date) -> list of timestamps
-        for event in events:
-            code = event.get("eventCode")
-            timestamp = event.get("eventTimestamp")
-            if code and timestamp:
-                date = get_date_from_timestamp(timestamp)
-                event_timestamps_by_date[(code, date)].append(timestamp)
-
-        # Sort timestamps chronologically within each group
-        for key in event_timestamps_by_date:
-            event_timestamps_by_date[key].sort()
-
-        # Group silent updates by date
-        silent_timestamps_by_date = defaultdict(list)
-        for silent_ts in silent_updates:
-            date = get_date_from_timestamp(silent_ts)
-            silent_timestamps_by_date[date].append(silent_ts)
-
-        # Sort timestamps chronologically within each group
-        for date in silent_timestamps_by_date:
-            silent_timestamps_by_date[date].sort()
-
-        # Build row
-        row = [
-            receipt["nickname"].ljust(col_widths[0]),
-            location.ljust(col_widths[1]),
+        if days_since_filing and "IAF" in events_by_code:
+            # First IAF in event order, as recorded
+            iaf_timestamp = timestamps[codes.index("IAF")]
+
+        # Map each (group_key, index) column to this receipt's timestamp for it.
+        # Each code's timestamps are already sorted, so every date is one contiguous run.
+        timestamps_by_column = {}
+        for code, code_timestamps in events_by_code.items():
+            for date, group in groupby(code_timestamps, key=get_date_from_timestamp):
+                for i, timestamp in enumerate(group):
+                    timestamps_by_column[((code, date), i)] = timestamp
+
+        for date, group in groupby(sorted(silent_updates), key=get_date_from_timestamp):
+            for i, timestamp in enumerate(group):
+                timestamps_by_column[(date, i)] = timestamp
+
+        # Build row in one pass over the precomputed column layout; most columns
+        # are empty, so those skip the formatter call entirely
+        get_timestamp = timestamps_by_column.get
+        cells = [
+            format_timeline_cell(timestamp, now, show_dates, iaf_timestamp)
+            if (timestamp := get_timestamp(column))
+            else EMPTY_CELL
+            for column in column_plan
         ]
-
-        # Track column index
-        col_idx = 2
-
-        # Add columns for each timeline entry
-        for item in timeline:
-            typ = item[0]
-            identifier = item[1]
-            date = item[2]
-            count = item[3]
-
-            if typ == "event":
-                # Get events for this (code, date) from this receipt
-                key = (identifier, date)
-                receipt_events = event_timestamps_by_date.get(key, [])
-
-                # Fill in columns (up to 'count' columns)
-                for i in range(count):
-                    if i < len(receipt_events):
-                        if show_dates:
-                            cell = get_short_date(receipt_events[i])
-                        elif days_since_filing and iaf_timestamp:
-                            cell = f"{get_days_between(iaf_timestamp, receipt_events[i])}d"
-                        else:
-                            cell = f"{get_days_since(receipt_events[i])}d"
-                        row.append(cell.ljust(col_widths[col_idx]))
-                    else:
-                        row.append("·".ljust(col_widths[col_idx]))
-                    col_idx += 1
-            else:  # silent update
-                # Get silent updates for this date from this receipt
-                receipt_silent = silent_timestamps_by_date.get(date, [])
-
-                # Fill in columns (up to 'count' columns)
-                for i in range(count):
-                    if i < len(receipt_silent):
-                        if show_dates:
-                            cell = get_short_date(receipt_silent[i])
-                        elif days_since_filing and iaf_timestamp:
-                            cell = f"{get_days_between(iaf_timestamp, receipt_silent[i])}d"
-                        else:
-                            cell = f"{get_days_since(receipt_silent[i])}d"
-                        row.append(cell.ljust(col_widths[col_idx]))
-                    else:
-                        row.append("·".ljust(col_widths[col_idx]))
-                    col_idx += 1
-
-        row_str = "".join(row)
+        row_str = format_row(receipt["nickname"], location, *cells)
 
         # Highlight changed rows in red
         # Use folder_name if available (for anon mode), otherwise nickname
         identifier = receipt.get("folder_name", receipt["nickname"])
-        if changed_nicknames and identifier in changed_nicknames:
-            print(f"{RED}{row_str}{RESET}")
+        if identifier in changed:
+            lines.append(f"{RED}{row_str}{RESET}")
         else:
-            print(row_str)
+            lines.append(row_str)
+
+    if out is None:
+        _write_lines(lines)
+    else:
+        out.extend(lines)
 
 
 def print_summary(changed_nicknames: Optional[set[str]] = None, anon: bool = False, days_since_filing: bool = False, show_dates: bool = False) -> None:
     """Print the summary tables, optionally highlighting changed nicknames."""
-    print("\nUSCIS Receipt Summary")
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    # Snapshot "now" once so the header and every table refer to the same moment
+    now = datetime.now(timezone.utc)
+
+    # Collect the whole summary and write it out once at the end
+    lines = ["", "USCIS Receipt Summary", f"Generated: {now.astimezone().strftime('%Y-%m-%d %H:%M:%S')}"]
 
     # Load anon mapping if requested
     anon_mapping = load_anon_mapping() if anon else None
 
     receipts = load_all_receipts(anon_mapping)
+    # Sort by nickname once; grouping preserves order, so each group comes out sorted
+    receipts.sort(key=itemgetter("nickname"))
     grouped = group_by_form_type(receipts)
+    if not grouped:
+        lines.extend(["", "(no receipts)", ""])
+        _write_lines(lines)
+        return
 
     # Fixed ordering
-    form_order = ["I-131", "I-765", "I-485"]
-    form_types = [f for f in form_order if f in grouped]
+    form_types = [f for f in FORM_ORDER if f in grouped]
     # Add any other form types not in the predefined order
-    form_types.extend(f for f in sorted(grouped.keys()) if f not in form_order)
+    form_types.extend(sorted(grouped.keys() - set(FORM_ORDER)))
 
     for form_type in form_types:
-        # Sort receipts by nickname within each group
-        grouped[form_type].sort(key=lambda r: r["nickname"])
-        print_table(form_type, grouped[form_type], changed_nicknames, days_since_filing, show_dates)
+        print_table(form_type, grouped[form_type], changed_nicknames, days_since_filing, show_dates, now, lines)
 
-    print()
+    lines.append("")
+    _write_lines(lines)
 
 
 def main():
@@ -6,50 +6,74 @@ Supports multiple accounts and cases.
 """
 
 import argparse
-import copy
 import difflib
 import json
-import time
-from datetime import datetime
-from typing import Optional
+import os
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
 from pathlib import Path
 
 from selenium import webdriver
 from pyotp import TOTP
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from deepdiff import DeepDiff
-from summary import print_summary
+from summary import json_dumps, json_loads, print_summary, slugify
 
 # File paths
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_FILE = SCRIPT_DIR / "config.json"
 OUTPUT_DIR = SCRIPT_DIR / "output"
 
+# Selenium's default script timeout, allowed per case when a case's API calls run in one script
+SCRIPT_TIMEOUT_PER_CASE = 30
+
+# Longest a single session probe may run, so the probe wait stays close to its own timeout
+PROBE_SCRIPT_TIMEOUT = 3
+
+# Sites an account session lives on, cleared between accounts sharing one browser
+USCIS_ORIGINS = ("https://myaccount.uscis.gov", "https://my.uscis.gov")
+
+# Rewrites DeepDiff paths in a single pass: drop the leading root, turn [' into . and drop ']
+_PATH_CLEAN = re.compile(r"^root|\['|'\]")
+_PATH_CLEAN_REPL = {"root": "", "['": ".", "']": ""}
+
 
 def load_config() -> dict:
     """Load configuration from config.json"""
     if not CONFIG_FILE.exists():
         raise FileNotFoundError(f"Config file not found: {CONFIG_FILE}")
 
-    with open(CONFIG_FILE, "r") as f:
-        return json.load(f)
+    return json_loads(CONFIG_FILE.read_bytes())
 
 
-def humanize_time_ago(timestamp_str: str) -> str:
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO timestamp into a timezone-aware datetime (UTC if no offset is given)"""
+    # USCIS timestamps end in Z: parse the rest and attach UTC directly
+    if timestamp_str.endswith('Z'):
+        return datetime.fromisoformat(timestamp_str[:-1]).replace(tzinfo=timezone.utc)
+    ts = datetime.fromisoformat(timestamp_str)
+    # Make it timezone-aware if it isn't
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+def humanize_time_ago(timestamp_str: str, now: Optional[datetime] = None) -> str:
     """Convert an ISO timestamp to a human-readable 'X hours and Y minutes ago' format"""
+    # Not a string (e.g. an epoch number from the API); show it as-is
+    if not isinstance(timestamp_str, str):
+        return timestamp_str
     try:
-        # Parse the timestamp
-        if timestamp_str.endswith('Z'):
-            timestamp_str = timestamp_str[:-1] + '+00:00'
-        ts = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        # Make it timezone-aware if it isn't
-        if ts.tzinfo is None:
-            from datetime import timezone
-            ts = ts.replace(tzinfo=timezone.utc)
-        now = datetime.now(ts.tzinfo)
+        ts = _parse_timestamp(timestamp_str)
+        if now is None:
+            now = datetime.now(ts.tzinfo)
         delta = now - ts
 
         total_seconds = int(delta.total_seconds())
@@ -71,108 +95,31 @@ def humanize_time_ago(timestamp_str: str) -> str:
         if not parts:
             return "just now"
         return " and ".join(parts[:2]) + " ago"
-    except Exception:
+    except (TypeError, ValueError):
+        # Not a parseable timestamp; show it as-is
         return timestamp_str
 
 
-def slugify(text: str) -> str:
-    """Convert text to a filesystem-safe slug"""
-    # Replace spaces and special chars with hyphens, lowercase
-    import re
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write a file via a temp file and os.replace, so readers never see it half-written"""
+    tmp_path = path.with_name(f".{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
+@lru_cache(maxsize=256)
 def get_case_output_dir(nickname: str) -> Path:
-    """Get the output directory for a specific case using nickname"""
+    """Get the output directory for a specific case using nickname (created on first use)"""
     folder_name = slugify(nickname)
     case_dir = OUTPUT_DIR / folder_name
     case_dir.mkdir(parents=True, exist_ok=True)
     return case_dir
 
 
-def save_latest(nickname: str, data: dict) -> Path:
-    """Save the latest case data to latest.json"""
-    case_dir = get_case_output_dir(nickname)
-    latest_file = case_dir / "latest.json"
-    with open(latest_file, "w") as f:
-        json.dump(data, f, indent=2)
-    return latest_file
-
-
-def load_latest(nickname: str) -> Optional[dict]:
-    """Load the previous case data from latest.json if it exists"""
-    case_dir = get_case_output_dir(nickname)
-    latest_file = case_dir / "latest.json"
-    if not latest_file.exists():
-        return None
-
-    with open(latest_file, "r") as f:
-        return json.load(f)
-
-
-def save_receipt_info(nickname: str, data: dict) -> Path:
-    """Save the receipt_info data to receipt_info.json"""
-    case_dir = get_case_output_dir(nickname)
-    receipt_info_file = case_dir / "receipt_info.json"
-    with open(receipt_info_file, "w") as f:
-        json.dump(data, f, indent=2)
-    return receipt_info_file
-
-
-def load_receipt_info(nickname: str) -> Optional[dict]:
-    """Load the previous receipt_info data if it exists"""
-    case_dir = get_case_output_dir(nickname)
-    receipt_info_file = case_dir / "receipt_info.json"
-    if not receipt_info_file.exists():
-        return None
-
-    with open(receipt_info_file, "r") as f:
-        return json.load(f)
-
-
-def save_documents(nickname: str, data: dict) -> Path:
-    """Save the documents data to documents.json"""
-    case_dir = get_case_output_dir(nickname)
-    documents_file = case_dir / "documents.json"
-    with open(documents_file, "w") as f:
-        json.dump(data, f, indent=2)
-    return documents_file
-
-
-def load_documents(nickname: str) -> Optional[dict]:
-    """Load the previous documents data if it exists"""
-    case_dir = get_case_output_dir(nickname)
-    documents_file = case_dir / "documents.json"
-    if not documents_file.exists():
-        return None
-
-    with open(documents_file, "r") as f:
-        return json.load(f)
-
-
-def save_case_status(nickname: str, data: dict) -> Path:
-    """Save the case_status data to case_status.json"""
-    case_dir = get_case_output_dir(nickname)
-    case_status_file = case_dir / "case_status.json"
-    with open(case_status_file, "w") as f:
-        json.dump(data, f, indent=2)
-    return case_status_file
-
-
-def load_case_status(nickname: str) -> Optional[dict]:
-    """Load the previous case_status data if it exists"""
-    case_dir = get_case_output_dir(nickname)
-    case_status_file = case_dir / "case_status.json"
-    if not case_status_file.exists():
-        return None
-
-    with open(case_status_file, "r") as f:
-        return json.load(f)
-
-
 def load_silent_updates(nickname: str) -> list[str]:
     """Load silent update timestamps from silent_updates.json"""
     case_dir = get_case_output_dir(nickname)
@@ -180,9 +127,8 @@ def load_silent_updates(nickname: str) -> list[str]:
     if not silent_updates_file.exists():
         return []
 
-    with open(silent_updates_file, "r") as f:
-        data = json.load(f)
-        return data.get("silent_updates", [])
+    data = json_loads(silent_updates_file.read_bytes())
+    return data.get("silent_updates", [])
 
 
 def save_silent_update(nickname: str, timestamp: str) -> Path:
@@ -198,12 +144,27 @@ def save_silent_update(nickname: str, timestamp: str) -> Path:
 
     # Save back
     data = {"silent_updates": silent_updates}
-    with open(silent_updates_file, "w") as f:
-        json.dump(data, f, indent=2)
+    _write_atomic(silent_updates_file, json_dumps(data))
 
     return silent_updates_file
 
 
+def diff_payloads(old_data: dict, new_data: dict) -> DeepDiff:
+    """
+    Diff the "data" payloads of two API responses.
+    The response envelope (e.g. the error field) is never reported on, so it is left out.
+    """
+    # With ignore_order, DeepDiff hashes and pairs list items; the cache lets repeated
+    # comparisons of the same items (events, notices) reuse that work.
+    return DeepDiff(
+        old_data.get("data"),
+        new_data.get("data"),
+        ignore_order=True,
+        cache_size=5000,
+        cache_tuning_sample_size=500,
+    )
+
+
 def is_silent_update(diff: dict) -> bool:
     """
     Check if a diff represents a silent update.
@@ -220,42 +181,25 @@ def is_silent_update(diff: dict) -> bool:
                 return False
 
     # No other change types allowed (additions, removals, etc.)
-    # Exception: Allow error field changes (artifact of API response format)
-    for key in diff.keys():
-        if key == "values_changed":
-            continue
-        if key in ["dictionary_item_added", "dictionary_item_removed"]:
-            # Check if only error field is being added/removed
-            for path in diff[key]:
-                if "['error']" not in path:
-                    return False
-        else:
-            # Any other diff type means it's not a silent update
-            return False
-
-    return True
+    return all(key == "values_changed" for key in diff.keys())
 
 
-# Registry of data sources with their load/save functions
+# Registry of data sources with the file each one is stored in, inside the case's output folder
 DATA_SOURCES = {
     "case_details": {
-        "load": load_latest,
-        "save": save_latest,
+        "file": "latest.json",
         "label": "Case details",
     },
     "receipt_info": {
-        "load": load_receipt_info,
-        "save": save_receipt_info,
+        "file": "receipt_info.json",
         "label": "Receipt info",
     },
     "documents": {
-        "load": load_documents,
-        "save": save_documents,
+        "file": "documents.json",
         "label": "Documents",
     },
     "case_status": {
-        "load": load_case_status,
-        "save": save_case_status,
+        "file": "case_status.json",
         "label": "Case status",
     },
 }
@@ -274,15 +218,26 @@ def process_data_source(
     """
     source = DATA_SOURCES[source_key]
     label = source["label"]
-    load_fn = source["load"]
-    save_fn = source["save"]
+    source_file = get_case_output_dir(nickname) / source["file"]
+
+    # Compare against the stored bytes first: an unchanged payload needs no diff, log or save
+    new_bytes = json_dumps(new_data)
+    try:
+        old_bytes = source_file.read_bytes()
+    except FileNotFoundError:
+        old_bytes = None
+    if old_bytes == new_bytes:
+        if source_key == "case_details":
+            print(f"  {nickname}: No changes")
+        return False, None
 
-    old_data = load_fn(nickname)
+    old_data = json_loads(old_bytes) if old_bytes is not None else None
     has_changes = False
     diff = None
 
     if old_data:
-        diff = DeepDiff(old_data, new_data, ignore_order=True)
+        # Equal payloads have nothing to diff; only walk them with DeepDiff when they differ
+        diff = diff_payloads(old_data, new_data) if old_data != new_data else {}
         if diff:
             has_changes = True
             # Special handling for case_details (main case data)
@@ -333,17 +288,18 @@ def process_data_source(
         elif new_data.get("data"):
             print(f"  {nickname}: {label} recorded")
 
-    # Save the new data
+    # Save the new data, reusing the bytes encoded for the comparison
     if not dry_run:
-        save_fn(nickname, new_data)
+        _write_atomic(source_file, new_bytes)
 
     return has_changes, diff
 
 
 def format_json_delta(old_data: dict, new_data: dict) -> str:
-    """Format a JSON delta showing added (+) and removed (-) lines"""
-    old_lines = json.dumps(old_data, indent=2).splitlines()
-    new_lines = json.dumps(new_data, indent=2).splitlines()
+    """Format a JSON delta of the "data" payloads showing added (+) and removed (-) lines"""
+    # Same scope as diff_payloads, so the delta never shows envelope changes the diff ignored
+    old_lines = json.dumps(old_data.get("data"), indent=2).splitlines()
+    new_lines = json.dumps(new_data.get("data"), indent=2).splitlines()
 
     differ = difflib.unified_diff(old_lines, new_lines, lineterm='')
 
@@ -360,31 +316,39 @@ def format_json_delta(old_data: dict, new_data: dict) -> str:
     return "\n".join(delta_lines) if delta_lines else ""
 
 
+def _categorize(diff: dict) -> list[tuple[str, str, Any, Any]]:
+    """Flatten a DeepDiff result into (kind, path, old_value, new_value) entries, in display order"""
+    changes = []
+    for path, change in diff.get("values_changed", {}).items():
+        changes.append(("values_changed", path, change["old_value"], change["new_value"]))
+    for path in diff.get("dictionary_item_added", ()):
+        changes.append(("dictionary_item_added", path, None, None))
+    for path in diff.get("dictionary_item_removed", ()):
+        changes.append(("dictionary_item_removed", path, None, None))
+    for path, value in diff.get("iterable_item_added", {}).items():
+        changes.append(("iterable_item_added", path, None, value))
+    for path, value in diff.get("iterable_item_removed", {}).items():
+        changes.append(("iterable_item_removed", path, value, None))
+    return changes
+
+
 def format_diff(diff: dict, old_data: dict, new_data: dict) -> str:
     """Format a DeepDiff result into a readable markdown string"""
     lines = []
 
-    if "values_changed" in diff:
-        for path, change in diff["values_changed"].items():
+    for kind, path, old_value, new_value in _categorize(diff):
+        if kind == "values_changed":
             lines.append(f"- **{path}**")
-            lines.append(f"  - Old: `{change['old_value']}`")
-            lines.append(f"  - New: `{change['new_value']}`")
-
-    if "dictionary_item_added" in diff:
-        for path in diff["dictionary_item_added"]:
+            lines.append(f"  - Old: `{old_value}`")
+            lines.append(f"  - New: `{new_value}`")
+        elif kind == "dictionary_item_added":
             lines.append(f"- **Added** {path}")
-
-    if "dictionary_item_removed" in diff:
-        for path in diff["dictionary_item_removed"]:
+        elif kind == "dictionary_item_removed":
             lines.append(f"- **Removed** {path}")
-
-    if "iterable_item_added" in diff:
-        for path, value in diff["iterable_item_added"].items():
-            lines.append(f"- **Added item** {path}: `{value}`")
-
-    if "iterable_item_removed" in diff:
-        for path, value in diff["iterable_item_removed"].items():
-            lines.append(f"- **Removed item** {path}: `{value}`")
+        elif kind == "iterable_item_added":
+            lines.append(f"- **Added item** {path}: `{new_value}`")
+        else:
+            lines.append(f"- **Removed item** {path}: `{old_value}`")
 
     # Add JSON delta section
     json_delta = format_json_delta(old_data, new_data)
@@ -398,36 +362,28 @@ def format_diff(diff: dict, old_data: dict, new_data: dict) -> str:
     return "\n".join(lines) if lines else "No specific changes detected"
 
 
+def _clean_path(path: str) -> str:
+    """Turn a DeepDiff path like root['events'][0] into events[0] for readability"""
+    return _PATH_CLEAN.sub(lambda m: _PATH_CLEAN_REPL[m.group()], path).lstrip(".")
+
+
 def format_diff_console(diff: dict, old_data: dict = None, new_data: dict = None) -> str:
     """Format a DeepDiff result for console output"""
     lines = []
 
-    if "values_changed" in diff:
-        for path, change in diff["values_changed"].items():
-            # Clean up the path for readability
-            clean_path = path.replace("root['data']", "").replace("['", ".").replace("']", "").lstrip(".")
+    for kind, path, old_value, new_value in _categorize(diff):
+        clean_path = _clean_path(path)
+        if kind == "values_changed":
             lines.append(f"    {clean_path}:")
-            lines.append(f"      - {change['old_value']}")
-            lines.append(f"      + {change['new_value']}")
-
-    if "dictionary_item_added" in diff:
-        for path in diff["dictionary_item_added"]:
-            clean_path = path.replace("root['data']", "").replace("['", ".").replace("']", "").lstrip(".")
+            lines.append(f"      - {old_value}")
+            lines.append(f"      + {new_value}")
+        elif kind == "dictionary_item_added":
             lines.append(f"    + Added: {clean_path}")
-
-    if "dictionary_item_removed" in diff:
-        for path in diff["dictionary_item_removed"]:
-            clean_path = path.replace("root['data']", "").replace("['", ".").replace("']", "").lstrip(".")
+        elif kind == "dictionary_item_removed":
             lines.append(f"    - Removed: {clean_path}")
-
-    if "iterable_item_added" in diff:
-        for path, value in diff["iterable_item_added"].items():
-            clean_path = path.replace("root['data']", "").replace("['", ".").replace("']", "").lstrip(".")
+        elif kind == "iterable_item_added":
             lines.append(f"    + New item in {clean_path}")
-
-    if "iterable_item_removed" in diff:
-        for path, value in diff["iterable_item_removed"].items():
-            clean_path = path.replace("root['data']", "").replace("['", ".").replace("']", "").lstrip(".")
+        else:
             lines.append(f"    - Removed item from {clean_path}")
 
     # Add JSON delta if old and new data are provided
@@ -442,25 +398,31 @@ def format_diff_console(diff: dict, old_data: dict = None, new_data: dict = None
     return "\n".join(lines) if lines else "    (details unavailable)"
 
 
+def _changelog_header(nickname: str, case_number: str) -> str:
+    """Header written at the top of a new changelog file"""
+    return (
+        f"# USCIS Case Changelog: {nickname}\n\n"
+        f"**Case Number:** {case_number}\n\n"
+        "This file tracks all changes detected in your USCIS case.\n\n"
+        "---\n\n"
+    )
+
+
 def append_changelog(nickname: str, case_number: str, diff: dict, old_data: dict, new_data: dict) -> Path:
     """Append a change entry to the changelog markdown file"""
     case_dir = get_case_output_dir(nickname)
     changelog_file = case_dir / "changelog.md"
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    entry = f"## {timestamp}\n\n{format_diff(diff, old_data, new_data)}\n\n---\n\n"
+
     # Create header if file doesn't exist
     if not changelog_file.exists():
-        with open(changelog_file, "w") as f:
-            f.write(f"# USCIS Case Changelog: {nickname}\n\n")
-            f.write(f"**Case Number:** {case_number}\n\n")
-            f.write("This file tracks all changes detected in your USCIS case.\n\n")
-            f.write("---\n\n")
+        entry = _changelog_header(nickname, case_number) + entry
 
-    # Append the change entry
+    # Append the change entry in a single write
     with open(changelog_file, "a") as f:
-        f.write(f"## {timestamp}\n\n")
-        f.write(format_diff(diff, old_data, new_data))
-        f.write("\n\n---\n\n")
+        f.write(entry)
 
     return changelog_file
 
@@ -470,47 +432,51 @@ def create_initial_changelog(nickname: str, case_number: str, data: dict = None)
     case_dir = get_case_output_dir(nickname)
     changelog_file = case_dir / "changelog.md"
 
+    # Build the whole file and write it once
+    parts = [
+        _changelog_header(nickname, case_number),
+        f"## {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Initial fetch\n\n",
+        "First case data recorded.\n\n",
+    ]
+
+    # Add initial state details if data is provided
+    if data and "data" in data:
+        inner = data["data"]
+        # One reference time for every "time ago" in the entry
+        now = datetime.now(timezone.utc)
+
+        # Last updated
+        updated_at = inner.get("updatedAtTimestamp")
+        if updated_at:
+            time_ago = humanize_time_ago(updated_at, now)
+            parts.append(f"**Last Updated:** {updated_at} ({time_ago})\n\n")
+
+        # Events summary
+        events = inner.get("events", [])
+        if events:
+            parts.append(f"**Events ({len(events)}):**\n")
+            for event in events:
+                event_code = event.get("eventCode", "Unknown")
+                event_time = event.get("createdAtTimestamp", "")
+                time_ago = humanize_time_ago(event_time, now) if event_time else ""
+                parts.append(f"- `{event_code}` - {event_time} ({time_ago})\n")
+            parts.append("\n")
+
+        # Notices summary
+        notices = inner.get("notices", [])
+        if notices:
+            parts.append(f"**Notices ({len(notices)}):**\n")
+            for notice in notices:
+                action_type = notice.get("actionType", "Unknown")
+                gen_date = notice.get("generationDate", "")
+                time_ago = humanize_time_ago(gen_date, now) if gen_date else ""
+                parts.append(f"- {action_type} - {gen_date} ({time_ago})\n")
+            parts.append("\n")
+
+    parts.append("---\n\n")
+
     with open(changelog_file, "w") as f:
-        f.write(f"# USCIS Case Changelog: {nickname}\n\n")
-        f.write(f"**Case Number:** {case_number}\n\n")
-        f.write("This file tracks all changes detected in your USCIS case.\n\n")
-        f.write("---\n\n")
-        f.write(f"## {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Initial fetch\n\n")
-        f.write("First case data recorded.\n\n")
-
-        # Add initial state details if data is provided
-        if data and "data" in data:
-            inner = data["data"]
-
-            # Last updated
-            updated_at = inner.get("updatedAtTimestamp")
-            if updated_at:
-                time_ago = humanize_time_ago(updated_at)
-                f.write(f"**Last Updated:** {updated_at} ({time_ago})\n\n")
-
-            # Events summary
-            events = inner.get("events", [])
-            if events:
-                f.write(f"**Events ({len(events)}):**\n")
-                for event in events:
-                    event_code = event.get("eventCode", "Unknown")
-                    event_time = event.get("createdAtTimestamp", "")
-                    time_ago = humanize_time_ago(event_time) if event_time else ""
-                    f.write(f"- `{event_code}` - {event_time} ({time_ago})\n")
-                f.write("\n")
-
-            # Notices summary
-            notices = inner.get("notices", [])
-            if notices:
-                f.write(f"**Notices ({len(notices)}):**\n")
-                for notice in notices:
-                    action_type = notice.get("actionType", "Unknown")
-                    gen_date = notice.get("generationDate", "")
-                    time_ago = humanize_time_ago(gen_date) if gen_date else ""
-                    f.write(f"- {action_type} - {gen_date} ({time_ago})\n")
-                f.write("\n")
-
-        f.write("---\n\n")
+        f.write("".join(parts))
 
     return changelog_file
 
@@ -521,34 +487,36 @@ def detect_important_changes(old_data: dict, new_data: dict) -> list[str]:
 
     old_inner = old_data.get("data", {})
     new_inner = new_data.get("data", {})
+    # One reference time for every "time ago" in the messages
+    now = datetime.now(timezone.utc)
 
     # Check for updatedAt change
     old_updated = old_inner.get("updatedAtTimestamp")
     new_updated = new_inner.get("updatedAtTimestamp")
     if old_updated != new_updated and new_updated:
-        time_ago = humanize_time_ago(new_updated)
+        time_ago = humanize_time_ago(new_updated, now)
         messages.append(f"Case updated {time_ago}")
 
     # Check for new events
-    old_events = {e.get("eventId"): e for e in old_inner.get("events", [])}
+    old_event_ids = {e.get("eventId") for e in old_inner.get("events", [])}
     new_events = new_inner.get("events", [])
     for event in new_events:
         event_id = event.get("eventId")
-        if event_id and event_id not in old_events:
+        if event_id and event_id not in old_event_ids:
             event_code = event.get("eventCode", "Unknown")
             event_time = event.get("createdAtTimestamp", "")
-            time_ago = humanize_time_ago(event_time) if event_time else ""
+            time_ago = humanize_time_ago(event_time, now) if event_time else ""
             messages.append(f"New '{event_code}' event added {time_ago}")
 
     # Check for new notices
-    old_notices = {n.get("letterId"): n for n in old_inner.get("notices", [])}
+    old_letter_ids = {n.get("letterId") for n in old_inner.get("notices", [])}
     new_notices = new_inner.get("notices", [])
     for notice in new_notices:
         letter_id = notice.get("letterId")
-        if letter_id and letter_id not in old_notices:
+        if letter_id and letter_id not in old_letter_ids:
             action_type = notice.get("actionType", "Unknown")
             gen_date = notice.get("generationDate", "")
-            time_ago = humanize_time_ago(gen_date) if gen_date else ""
+            time_ago = humanize_time_ago(gen_date, now) if gen_date else ""
             messages.append(f"New notice: '{action_type}' {time_ago}")
 
     return messages
@@ -556,35 +524,55 @@ def detect_important_changes(old_data: dict, new_data: dict) -> list[str]:
 
 def print_change_alert(nickname: str, case_number: str, diff: dict, old_data: dict = None, new_data: dict = None):
     """Print a prominent alert when changes are detected"""
-    print("\n" + "!" * 60)
-    print("!" * 60)
-    print(f"!!!  CHANGE DETECTED: {nickname}")
-    print(f"!!!  Case: {case_number}")
-    print("!" * 60)
+    banner = "!" * 60
+    lines = ["", banner, banner, f"!!!  CHANGE DETECTED: {nickname}", f"!!!  Case: {case_number}", banner]
 
     # Show human-readable important changes if we have the data
     if old_data and new_data:
         important = detect_important_changes(old_data, new_data)
         if important:
-            print("\n  Summary:")
-            for msg in important:
-                print(f"    -> {msg}")
+            lines.append("\n  Summary:")
+            lines.extend(f"    -> {msg}" for msg in important)
+
+    lines.append("\n  Details:")
+    lines.append(format_diff_console(diff, old_data, new_data))
+    lines.append("\n" + banner)
+    lines.append(banner + "\n")
+
+    # Emit the whole alert in one write
+    print("\n".join(lines))
+
 
-    print("\n  Details:")
-    print(format_diff_console(diff, old_data, new_data))
-    print("\n" + "!" * 60)
-    print("!" * 60 + "\n")
+def create_driver(browser_config: dict) -> webdriver.Chrome:
+    """Start a Chrome driver configured for USCIS"""
+    options = Options()
+
+    if browser_config.get("headless", False):
+        options.add_argument("--headless=new")
+
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1400,900")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+
+    # Selenium Manager handles Chrome/chromedriver automatically
+    # No implicit wait: every lookup that may need to wait uses an explicit WebDriverWait
+    return webdriver.Chrome(options=options)
 
 
 class USCISWatcher:
-    def __init__(self, account: dict, browser_config: dict, verbose: bool = False):
+    def __init__(self, account: dict, browser_config: dict, verbose: bool = False, driver: Optional[webdriver.Chrome] = None):
         self.username = account["username"]
         self.password = account["password"]
         self.totp_secret = account["totp_secret"]
         self.account_name = account.get("name", "default")
         self.cases = account["cases"]
         self.browser_config = browser_config
-        self.driver = None
+        # A driver passed in is shared with other accounts; only quit one we started ourselves
+        self.driver = driver
+        self.owns_driver = driver is None
         self.verbose = verbose
 
     def log(self, message: str):
@@ -594,21 +582,8 @@ class USCISWatcher:
 
     def _setup_driver(self):
         """Initialize the Chrome driver"""
-        options = Options()
-
-        if self.browser_config.get("headless", False):
-            options.add_argument("--headless=new")
-
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1400,900")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        # Selenium Manager handles Chrome/chromedriver automatically
-        self.driver = webdriver.Chrome(options=options)
-        self.driver.implicitly_wait(10)
+        self.driver = create_driver(self.browser_config)
+        self.owns_driver = True
 
     def login(self) -> None:
         """Log into USCIS account"""
@@ -627,7 +602,9 @@ class USCISWatcher:
         )
         email_field.send_keys(self.username)
 
-        password_field = self.driver.find_element(By.ID, "password")
+        password_field = wait.until(
+            EC.presence_of_element_located((By.ID, "password"))
+        )
         password_field.send_keys(self.password)
 
         self.log("Signing in...")
@@ -657,74 +634,118 @@ class USCISWatcher:
 
         self.log("Login successful!")
 
-    def fetch_all_case_data(self, case_number: str) -> dict:
-        """Fetch all case data from multiple APIs in parallel"""
+    def fetch_all_cases_data(self, case_numbers: list[str]) -> dict[str, dict]:
+        """Fetch all case data for several cases in parallel, in a single browser round trip"""
         if not self.driver:
             self.login()
 
-        # Define all API endpoints
-        apis = {
-            "case_details": f"https://my.uscis.gov/account/case-service/api/cases/{case_number}",
-            "receipt_info": f"https://my.uscis.gov/secure-messaging/api/case-service/receipt_info/{case_number}",
-            "documents": f"https://my.uscis.gov/account/case-service/api/cases/{case_number}/documents",
-            "case_status": f"https://my.uscis.gov/account/case-service/api/case_status/{case_number}",
-        }
-
-        # Build the JavaScript for parallel fetching
-        api_entries = ", ".join([f'["{key}", "{url}"]' for key, url in apis.items()])
-
-        result = self.driver.execute_async_script(f"""
+        # Define all API endpoints, one [case_number, key, url] entry per request
+        requests = []
+        for case_number in case_numbers:
+            apis = {
+                "case_details": f"https://my.uscis.gov/account/case-service/api/cases/{case_number}",
+                "receipt_info": f"https://my.uscis.gov/secure-messaging/api/case-service/receipt_info/{case_number}",
+                "documents": f"https://my.uscis.gov/account/case-service/api/cases/{case_number}/documents",
+                "case_status": f"https://my.uscis.gov/account/case-service/api/case_status/{case_number}",
+            }
+            requests.extend([case_number, key, url] for key, url in apis.items())
+
+        # Every fetch shares one script call, so give it each case's worth of Selenium's default timeout
+        self.driver.set_script_timeout(SCRIPT_TIMEOUT_PER_CASE * max(1, len(case_numbers)))
+
+        result = self.driver.execute_async_script("""
             var callback = arguments[arguments.length - 1];
-            var apis = [{api_entries}];
+            var requests = arguments[0];
 
-            Promise.all(apis.map(([key, url]) =>
-                fetch(url, {{
+            Promise.all(requests.map(([caseNumber, key, url]) =>
+                fetch(url, {
                     method: 'GET',
                     credentials: 'include'
-                }})
-                .then(response => response.text().then(text => ({{
+                })
+                .then(response => response.text().then(text => ({
+                    caseNumber: caseNumber,
                     key: key,
                     status: response.status,
                     body: text
-                }})))
-                .catch(error => ({{
+                })))
+                .catch(error => ({
+                    caseNumber: caseNumber,
                     key: key,
                     error: error.message
-                }}))
+                }))
             ))
-            .then(results => {{
-                var output = {{}};
-                results.forEach(r => {{
-                    output[r.key] = r;
-                }});
-                callback(JSON.stringify(output));
-            }})
-            .catch(error => callback(JSON.stringify({{"error": error.message}})));
-        """)
+            .then(results => {
+                var output = {};
+                results.forEach(r => {
+                    (output[r.caseNumber] = output[r.caseNumber] || {})[r.key] = r;
+                });
+                // Returned as-is: WebDriver serializes it, so no extra stringify/parse round
+                callback(output);
+            })
+            .catch(error => callback({"error": error.message}));
+        """, requests)
 
         if not result:
-            raise Exception(f"Failed to fetch case data for {case_number}")
+            raise Exception(f"Failed to fetch case data for {', '.join(case_numbers)}")
 
-        raw_results = json.loads(result)
+        raw_results = result
         if "error" in raw_results:
             raise Exception(f"Fetch error: {raw_results['error']}")
 
         # Process each API result
-        processed = {}
-        for key, data in raw_results.items():
-            if "error" in data:
-                self.log(f"{key} error [{case_number}]: {data['error']}")
-                processed[key] = {"data": None, "error": data['error']}
-            elif data.get("status") != 200:
-                self.log(f"{key} status [{case_number}]: {data.get('status')}")
-                processed[key] = {"data": None, "error": f"Status {data.get('status')}"}
-            else:
-                try:
-                    processed[key] = json.loads(data["body"])
-                except json.JSONDecodeError:
-                    processed[key] = {"data": None, "error": "Invalid JSON response"}
-
-        return processed
+        all_processed = {}
+        for case_number in case_numbers:
+            processed = {}
+            for key, data in raw_results.get(case_number, {}).items():
+                if "error" in data:
+                    self.log(f"{key} error [{case_number}]: {data['error']}")
+                    processed[key] = {"data": None, "error": data['error']}
+                elif data.get("status") != 200:
+                    self.log(f"{key} status [{case_number}]: {data.get('status')}")
+                    processed[key] = {"data": None, "error": f"Status {data.get('status')}"}
+                else:
+                    # Bodies stay raw text in the browser and are decoded once here, so
+                    # large integers and number formatting survive exactly as sent
+                    try:
+                        processed[key] = json_loads(data["body"])
+                    except json.JSONDecodeError:
+                        processed[key] = {"data": None, "error": "Invalid JSON response"}
+            all_processed[case_number] = processed
+
+        return all_processed
+
+    def _wait_for_case_api(self, timeout: int = 10) -> None:
+        """Wait until the case API accepts this session, instead of sleeping a fixed time"""
+        if not self.cases:
+            return
+        probe_url = f"https://my.uscis.gov/account/case-service/api/cases/{self.cases[0]['case_number']}"
+
+        def session_ready(driver) -> bool:
+            # The portal is ready once the API stops rejecting the session as unauthenticated.
+            # Only the status is needed, so the body is cancelled instead of downloaded.
+            return driver.execute_async_script("""
+                var callback = arguments[arguments.length - 1];
+                fetch(arguments[0], {method: 'GET', credentials: 'include'})
+                    .then(response => {
+                        if (response.body) response.body.cancel();
+                        callback(response.status !== 401 && response.status !== 403);
+                    })
+                    .catch(() => callback(false));
+            """, probe_url)
+
+        # A probe that hangs counts as not ready rather than running on under the longer fetch timeout
+        previous_script_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(PROBE_SCRIPT_TIMEOUT)
+        try:
+            WebDriverWait(
+                self.driver, timeout, poll_frequency=0.5, ignored_exceptions=(TimeoutException,)
+            ).until(session_ready)
+        except WebDriverException as e:
+            # Timed out or the probe itself failed: go ahead anyway, and any case that
+            # still can't be fetched reports its own error
+            self.log(f"Case portal session not confirmed, continuing: {e.msg or type(e).__name__}")
+        finally:
+            self.driver.set_script_timeout(previous_script_timeout)
 
     def process_all_cases(self, dry_run: bool = False) -> tuple[int, set[str]]:
         """Process all cases for this account. Returns (number of changes, set of changed nicknames)."""
@@ -733,18 +754,28 @@ class USCISWatcher:
         # Navigate to my.uscis.gov first to establish session context
         self.log("Navigating to case portal...")
         self.driver.get("https://my.uscis.gov/account")
-        time.sleep(3)
+        self._wait_for_case_api()
 
         changes_detected = 0
         changed_nicknames = set()
 
+        # Fetch every case for this account in a single browser round trip
+        try:
+            all_case_data = self.fetch_all_cases_data([case["case_number"] for case in self.cases])
+        except Exception as e:
+            # Fall back to one fetch per case below, so one slow or failing case can't sink the rest
+            self.log(f"Batch fetch failed, fetching cases one at a time: {e}")
+            all_case_data = {}
+
         for case in self.cases:
             case_number = case["case_number"]
             nickname = case["nickname"]
 
             try:
-                # Fetch all case data in parallel
-                all_data = self.fetch_all_case_data(case_number)
+                if case_number in all_case_data:
+                    all_data = all_case_data[case_number]
+                else:
+                    all_data = self.fetch_all_cases_data([case_number])[case_number]
 
                 case_has_changes = False
 
@@ -769,11 +800,40 @@ class USCISWatcher:
 
         return changes_detected, changed_nicknames
 
-    def close(self):
-        """Close the browser"""
+    def reset_session(self):
+        """Sign out: clear cookies and site data, then move the browser to a fresh tab for the next account"""
+        if not self.driver:
+            return
+        # Site data is per origin, so clear it for every site that set a cookie as well as the USCIS portals
+        cookies = self.driver.execute_cdp_cmd("Storage.getCookies", {}).get("cookies", [])
+        origins = set(USCIS_ORIGINS) | {f"https://{cookie['domain'].lstrip('.')}" for cookie in cookies}
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins:
+            self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+        # sessionStorage belongs to the tab, so carry on in a new tab and close the old one
+        old_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window("tab")
+        new_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(old_handle)
+        self.driver.close()
+        self.driver.switch_to.window(new_handle)
+
+    def close(self) -> bool:
+        """Close the browser, or just reset the session if the driver is shared.
+        Returns False if a shared browser could not be reset and must not be reused."""
+        reset_ok = True
         if self.driver:
-            self.driver.quit()
+            if self.owns_driver:
+                self.driver.quit()
+            else:
+                try:
+                    self.reset_session()
+                except Exception as e:
+                    print(f"  {self.account_name}: could not reset browser session - {e}")
+                    reset_ok = False
             self.driver = None
+        return reset_ok
 
 
 def simulate_diff():
@@ -795,22 +855,21 @@ def simulate_diff():
 
     # Find the output directory using nickname
     case_dir = get_case_output_dir(nickname)
-    latest_file = case_dir / "latest.json"
+    latest_file = case_dir / DATA_SOURCES["case_details"]["file"]
 
     if not latest_file.exists():
         print(f"No latest.json found for {nickname}. Run the watcher first to get initial data.")
         return
 
     # Load current data
-    with open(latest_file, "r") as f:
-        current_data = json.load(f)
+    current_data = json_loads(latest_file.read_bytes())
 
-    # Create simulated "new" data with changes
-    simulated_new = copy.deepcopy(current_data)
+    # Create simulated "new" data with changes, copying only the containers that change
+    simulated_new = dict(current_data)
 
     # Simulate some realistic changes
     if "data" in simulated_new:
-        data = simulated_new["data"]
+        data = simulated_new["data"] = dict(current_data["data"])
 
         # Change 1: Update the status date
         data["updatedAt"] = "2025-12-30"
@@ -829,7 +888,7 @@ def simulate_diff():
             "eventTimestamp": "2025-12-30T15:30:00.000Z"
         }
         if "events" in data:
-            data["events"].insert(0, new_event)
+            data["events"] = [new_event, *data["events"]]
 
         # Change 3: Add a new notice
         new_notice = {
@@ -839,10 +898,10 @@ def simulate_diff():
             "actionType": "Case Approved"
         }
         if "notices" in data:
-            data["notices"].insert(0, new_notice)
+            data["notices"] = [new_notice, *data["notices"]]
 
     # Compare
-    diff = DeepDiff(current_data, simulated_new, ignore_order=True)
+    diff = diff_payloads(current_data, simulated_new)
 
     print(f"\nSimulating changes for: {nickname} ({case_number})")
     print("-" * 60)
@@ -895,23 +954,34 @@ def main():
     total_changes = 0
     all_changed_nicknames = set()
 
-    # Process each account
-    for account in accounts:
-        account_name = account.get("name", "default")
-        print(f"\nAccount: {account_name}")
-        print("-" * 40)
+    # Start the browser once and reuse it for every account
+    driver = create_driver(browser_config)
+
+    try:
+        # Process each account
+        for index, account in enumerate(accounts):
+            account_name = account.get("name", "default")
+            print(f"\nAccount: {account_name}")
+            print("-" * 40)
 
-        watcher = USCISWatcher(account, browser_config, verbose=args.verbose)
+            watcher = USCISWatcher(account, browser_config, verbose=args.verbose, driver=driver)
 
-        try:
-            changes, changed_nicknames = watcher.process_all_cases(dry_run=args.dry_run)
-            total_changes += changes
-            all_changed_nicknames.update(changed_nicknames)
-        except Exception as e:
-            print(f"Error processing account {account_name}: {e}")
-            raise
-        finally:
-            watcher.close()
+            try:
+                changes, changed_nicknames = watcher.process_all_cases(dry_run=args.dry_run)
+                total_changes += changes
+                all_changed_nicknames.update(changed_nicknames)
+            except Exception as e:
+                # The browser is quit below, so there is no session to reset
+                print(f"Error processing account {account_name}: {e}")
+                raise
+
+            # The last account's session goes away with the browser. Otherwise clear it for the
+            # next account, and start a fresh browser if that fails so accounts never share a login.
+            if index < len(accounts) - 1 and not watcher.close():
+                driver.quit()
+                driver = create_driver(browser_config)
+    finally:
+        driver.quit()
 
     # Summary
     print("\n" + "=" * 40)